@@ -1,74 +1,474 @@
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
 """
 Generative AI Powered Curriculum Design System
 A comprehensive system for designing academic curricula using AI
 """
 
 import os
-import json
+import re
+import time
+import asyncio
+import hashlib
+import functools
+import threading
+import concurrent.futures
+from collections import OrderedDict
+import diskcache
+import zstandard as zstd
+import httpx
+import numpy as np
 from dotenv import load_dotenv
 import gradio as gr
-from groq import Groq
+from groq import AsyncGroq
+
+# Optional semantic cache dependencies
+try:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
 
-# Initialize Groq client
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# Initialize Groq client (async so independent sections can run concurrently).
+# A single HTTP/2 connection pool is shared by every request so concurrent
+# sections multiplex over kept-alive connections instead of new TLS handshakes.
+# Pooling options live on the transport, which takes precedence over the
+# client-level settings once a custom transport is given.
+KEEPALIVE_EXPIRY = 300  # seconds an idle connection is kept open
+http_client = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=32,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        )
+    ),
+    timeout=httpx.Timeout(60.0, connect=5.0)
+)
+client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"), http_client=http_client)
 MODEL = "llama-3.3-70b-versatile"
 
+# Output token budgets per generator. These are provisional estimates that
+# have not been profiled against real responses; a response cut off at its
+# budget is shown but never cached, so raising a budget takes effect at once.
+MAX_TOKENS = {
+    "generate_course_structure": 1400,
+    "recommend_topics": 1200,
+    "create_curriculum_plan": 2000,
+    "map_learning_outcomes": 1800,
+    "optimize_curriculum": 1600,
+    "generate_combined": 5000,
+}
+
+# Persistent response cache so identical requests are not billed twice
+CACHE_DIR = ".curriculum_cache"
+CACHE_TTL = 7 * 24 * 60 * 60  # 7 days, in seconds
+cache = diskcache.Cache(CACHE_DIR)
+
+# Cached Markdown is stored zstd-compressed. Compressor objects must not be
+# used by two threads at once, so each executor thread gets its own pair.
+CACHE_COMPRESSION_LEVEL = 3
+_zstd_local = threading.local()
+
+# Worker threads for blocking work (disk cache IO, embeddings) so it never
+# stalls the event loop that is streaming other sections
+EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+# Semantic cache: reuse responses for near-duplicate inputs
+# (e.g. "Data Structures" vs "data structures and algorithms")
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.92
+_embedder = None
+_embedder_lock = threading.Lock()
+# (generator name, *exact inputs) -> (faiss index, parallel list of responses).
+# Fields such as level and duration change the output outright, so they
+# partition the indices exactly instead of being part of the fuzzy match.
+# Both the number of partitions and the entries in each are capped so the
+# in-memory cache stays bounded in a long-running server.
+SEMANTIC_MAX_PARTITIONS = 64
+SEMANTIC_MAX_ENTRIES = 128
+_semantic_indices = OrderedDict()
+
 
 # ============================================================================
-# CORE CURRICULUM GENERATION FUNCTIONS
+# PROMPT TEMPLATES
 # ============================================================================
+# Each prompt starts with a long static prefix (system message plus fixed
+# instructions) and appends the user's inputs at the end. Groq, OpenAI and
+# Anthropic cache prompts by their longest common prefix, so repeated calls
+# only pay full input-token cost for the dynamic suffix. Keep these strings
+# free of per-request values; they may only be composed from other constants.
+
+PROMPT_INPUTS_SEPARATOR = "\n\n---\nInputs:\n"
+
+# Completion marker passed as a stop sequence so generation ends as soon as
+# the deliverable is complete
+END_MARKER = "---END---"
+END_INSTRUCTION = f"\n\nEnd your response with the literal marker: {END_MARKER}"
 
-def generate_course_structure(subject, level, duration, goals):
+
+@functools.lru_cache(maxsize=256)
+def build_header(subject, level, duration=None, goals=None, focus_area=None):
     """
-    Generate a structured course outline with modules and topics.
+    Build the shared inputs block used by every prompt.
     
-    Args:
-        subject: The subject/course name
-        level: Academic level (school/college/university)
-        duration: Duration in weeks or semesters
-        goals: Learning goals and objectives
+    Fields are always emitted in the same order and empty ones are skipped,
+    so sibling prompts for one request share an identical inputs prefix.
     
     Returns:
-        Structured course outline as formatted text
+        Newline-separated "Label: value" lines
     """
-    prompt = f"""You are an expert academic curriculum designer. Generate a comprehensive course structure for:
+    fields = [
+        ("Subject", subject),
+        ("Academic Level", level),
+        ("Duration", duration),
+        ("Learning Goals", goals),
+        ("Focus Area", focus_area),
+    ]
+    return "\n".join(f"{label}: {value}" for label, value in fields if value)
 
-Subject: {subject}
-Academic Level: {level}
-Duration: {duration}
-Learning Goals: {goals}
-
-Create a detailed course structure with:
-1. Course title and description
+# Numbered requirements shared by the per-section prompts and the combined
+# prompt, so both views ask for exactly the same content
+STRUCTURE_REQUIREMENTS = """1. Course title and description
 2. 5-8 major modules/units
 3. 3-5 topics under each module
-4. Brief description for each module
+4. Brief description for each module"""
+
+TOPICS_REQUIREMENTS = """1. 10-15 recommended topics
+2. Brief justification for each topic's inclusion
+3. Suggested depth of coverage (introductory/intermediate/advanced)
+4. Prerequisites if any"""
+
+OUTCOMES_REQUIREMENTS = """1. 3-5 specific learning outcomes using Bloom's Taxonomy
+2. Use action verbs (understand, analyze, create, evaluate, apply, etc.)
+3. Make outcomes measurable and assessable
+4. Align outcomes with the academic level
+5. Include cognitive, skill-based, and affective outcomes where appropriate
+
+Format: Module/Topic → Learning Outcomes (numbered list)"""
+
+STRUCTURE_SYSTEM = "You are an expert academic curriculum designer who creates structured, comprehensive course outlines."
+STRUCTURE_INSTRUCTIONS = f"""You are an expert academic curriculum designer. Generate a comprehensive course structure for the inputs given below.
+
+Create a detailed course structure with:
+{STRUCTURE_REQUIREMENTS}
 
 Format the response clearly with headers and bullet points. Be structured and academic."""
+STRUCTURE_ERROR_PREFIX = "Error generating course structure"
+
+TOPICS_SYSTEM = "You are an expert academic curriculum designer who recommends relevant and impactful learning topics."
+TOPICS_INSTRUCTIONS = f"""You are an expert academic curriculum designer. Recommend relevant topics for the inputs given below.
+
+Provide:
+{TOPICS_REQUIREMENTS}
+
+Be specific and academically rigorous."""
+
+TIMELINE_SYSTEM = "You are an expert academic curriculum designer who creates realistic, well-paced learning schedules."
+TIMELINE_INSTRUCTIONS = """You are an expert academic curriculum designer. Create a detailed timeline-based curriculum plan for the inputs given below.
+
+Create a week-by-week or session-by-session plan that includes:
+1. Clear timeline (Week 1, Week 2, etc. or Session 1, Session 2, etc.)
+2. Topics to be covered in each period
+3. Suggested activities (lectures, labs, assignments, assessments)
+4. Estimated hours per topic
+5. Key milestones and assessment points
+
+Ensure logical progression from basics to advanced concepts. Be realistic about pacing."""
+
+OUTCOMES_SYSTEM = "You are an expert academic curriculum designer who writes clear, measurable learning outcomes aligned with Bloom's Taxonomy."
+OUTCOMES_INSTRUCTIONS = f"""You are an expert academic curriculum designer. Create measurable learning outcomes for the inputs given below.
+
+For each major module/topic, define:
+{OUTCOMES_REQUIREMENTS}
+
+Be precise and use proper educational outcome language."""
+OUTCOMES_ERROR_PREFIX = "Error mapping learning outcomes"
+
+OPTIMIZE_SYSTEM = "You are an expert academic curriculum designer who optimizes learning experiences for maximum effectiveness and balance."
+OPTIMIZE_INSTRUCTIONS = """You are an expert academic curriculum designer. Optimize the curriculum for the inputs given below.
+
+Analyze and optimize for:
+1. **Difficulty Progression**: Ensure smooth transition from basic to advanced
+2. **Topic Relevance**: Prioritize high-impact, industry-relevant topics
+3. **Academic Balance**: Balance theory, practice, and assessments
+4. **Cognitive Load**: Avoid overwhelming students in any period
+5. **Redundancy**: Identify and eliminate duplicate content
+6. **Gaps**: Identify missing critical topics
+
+Provide:
+- Overall curriculum health score (0-100)
+- Specific optimization recommendations
+- Suggested reordering or restructuring
+- Balance metrics (theory vs practice ratio, assessment distribution)
+
+Be critical and constructive."""
+
+
+# Single-call prompt used by the full curriculum view. It asks for the
+# structure, topics and outcomes sections in one response so the shared
+# inputs are sent, and the request overhead paid, only once.
+SECTION_MARKER = "===SECTION==="
+COMBINED_SECTION_KEYS = ["structure", "topics", "outcomes"]
+COMBINED_ERROR_PREFIX = "Error generating curriculum sections"
 
+COMBINED_SYSTEM = "You are an expert academic curriculum designer who creates structured course outlines, recommends impactful topics and writes measurable learning outcomes aligned with Bloom's Taxonomy."
+COMBINED_INSTRUCTIONS = f"""You are an expert academic curriculum designer. For the inputs given below, emit exactly three sections in this order: STRUCTURE, TOPICS, OUTCOMES. Separate consecutive sections with a line containing only {SECTION_MARKER}. Do not put the marker before the first section or after the last one, and do not add a label line for each section.
+
+STRUCTURE - a detailed course structure with:
+{STRUCTURE_REQUIREMENTS}
+
+TOPICS - recommended topics with:
+{TOPICS_REQUIREMENTS}
+
+OUTCOMES - for each module of the STRUCTURE section:
+{OUTCOMES_REQUIREMENTS}
+
+Format every section clearly with headers and bullet points. Be structured, specific and academically rigorous."""
+
+
+# System messages are built once and reused by every request
+STRUCTURE_SYSTEM_MSG = {"role": "system", "content": STRUCTURE_SYSTEM}
+TOPICS_SYSTEM_MSG = {"role": "system", "content": TOPICS_SYSTEM}
+TIMELINE_SYSTEM_MSG = {"role": "system", "content": TIMELINE_SYSTEM}
+OUTCOMES_SYSTEM_MSG = {"role": "system", "content": OUTCOMES_SYSTEM}
+OPTIMIZE_SYSTEM_MSG = {"role": "system", "content": OPTIMIZE_SYSTEM}
+COMBINED_SYSTEM_MSG = {"role": "system", "content": COMBINED_SYSTEM}
+
+
+# ============================================================================
+# CORE CURRICULUM GENERATION FUNCTIONS
+# ============================================================================
+
+def _load_embedder():
+    """
+    Load the sentence embedding model once, downloading it if needed.
+    """
+    global _embedder
+    with _embedder_lock:
+        if _embedder is None:
+            _embedder = SentenceTransformer(EMBEDDING_MODEL)
+    return _embedder
+
+
+def _embed(text):
+    """
+    Embed text as a normalized float32 row vector, or None if embedding fails.
+    """
+    try:
+        vector = np.asarray(_load_embedder().encode([text]), dtype="float32")
+        faiss.normalize_L2(vector)
+        return vector
+    except Exception:
+        return None
+
+
+def _semantic_lookup(partition, vector):
+    """
+    Return the cached response closest to vector if it is similar enough.
+    """
+    entry = _semantic_indices.get(partition)
+    if entry is None or entry[0].ntotal == 0:
+        return None
+    _semantic_indices.move_to_end(partition)
+    index, responses = entry
+    scores, ids = index.search(vector, 1)
+    if scores[0][0] > SEMANTIC_THRESHOLD:
+        return responses[ids[0][0]]
+    return None
+
+
+def _semantic_store(partition, vector, response):
+    """
+    Add a response to the semantic index of the given partition.
+    
+    The least recently used partition and the oldest entry of a full
+    partition are evicted to respect the size caps.
+    """
+    if partition not in _semantic_indices:
+        if len(_semantic_indices) >= SEMANTIC_MAX_PARTITIONS:
+            _semantic_indices.popitem(last=False)
+        _semantic_indices[partition] = (faiss.IndexFlatIP(vector.shape[1]), [])
+    _semantic_indices.move_to_end(partition)
+    index, responses = _semantic_indices[partition]
+    if len(responses) >= SEMANTIC_MAX_ENTRIES:
+        # Flat indices renumber on removal, matching the list after pop(0)
+        index.remove_ids(np.array([0], dtype=np.int64))
+        responses.pop(0)
+    index.add(vector)
+    responses.append(response)
+
+
+async def _run_blocking(fn, *args, **kwargs):
+    """
+    Run a blocking function on the shared executor and await its result.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(EXECUTOR, functools.partial(fn, *args, **kwargs))
+
+
+def _zstd_codecs():
+    """
+    Return this thread's (compressor, decompressor) pair, creating it once.
+    """
+    codecs = getattr(_zstd_local, "codecs", None)
+    if codecs is None:
+        codecs = _zstd_local.codecs = (
+            zstd.ZstdCompressor(level=CACHE_COMPRESSION_LEVEL),
+            zstd.ZstdDecompressor()
+        )
+    return codecs
+
+
+def _cache_get(key):
+    """
+    Read and decompress a cached response, or None on a miss.
+    
+    Unreadable entries and cache errors count as a miss, so the caller falls
+    back to the API instead of failing.
+    """
     try:
-        response = client.chat.completions.create(
+        raw = cache.get(key)
+        if raw is None or isinstance(raw, str):
+            # Entries written before compression was enabled are plain strings
+            return raw
+        return _zstd_codecs()[1].decompress(raw).decode("utf-8")
+    except Exception:
+        try:
+            cache.delete(key)
+        except Exception:
+            pass
+        return None
+
+
+def _cache_set(key, text):
+    """
+    Compress and store a response in the disk cache; failures are ignored.
+    """
+    try:
+        cache.set(key, _zstd_codecs()[0].compress(text.encode("utf-8")), expire=CACHE_TTL)
+    except Exception:
+        pass
+
+
+def _cache_key(name, system_prompt, prompt):
+    """
+    Build the response cache key for a generator call.
+    """
+    return hashlib.sha256(f"{name}|{MODEL}|{system_prompt}|{prompt}".encode("utf-8")).hexdigest()
+
+
+async def _stream_completion(name, system_message, prompt, temperature, max_tokens, error_prefix,
+                             semantic_key=None, semantic_scope=()):
+    """
+    Stream a chat completion from Groq, yielding the accumulated text.
+    
+    Completed responses are stored in the disk cache; a cache hit is
+    yielded in full without calling the API. When semantic_key is given and
+    the semantic cache is available, a response for similar inputs is
+    reused as well.
+    
+    Args:
+        name: Name of the calling generator, used to namespace the cache
+        system_message: Prebuilt system message dict
+        prompt: User message content
+        temperature: Sampling temperature
+        max_tokens: Maximum number of output tokens
+        error_prefix: Message prefix shown if the request fails
+        semantic_key: Canonical input string for semantic matching (optional)
+        semantic_scope: Inputs that must match exactly for a semantic hit
+    
+    Yields:
+        The response text received so far
+    """
+    key = _cache_key(name, system_message["content"], prompt)
+    cached = await _run_blocking(_cache_get, key)
+    if cached is not None:
+        yield cached
+        return
+    
+    vector = None
+    if semantic_key and SEMANTIC_CACHE_AVAILABLE:
+        vector = await _run_blocking(_embed, semantic_key)
+        if vector is not None:
+            cached = _semantic_lookup((name, *semantic_scope), vector)
+            if cached is not None:
+                yield cached
+                return
+    
+    buffer = ""
+    finish_reason = None
+    try:
+        response = await client.chat.completions.create(
             model=MODEL,
             messages=[
-                {"role": "system", "content": "You are an expert academic curriculum designer who creates structured, comprehensive course outlines."},
-                {"role": "user", "content": prompt}
+                system_message,
+                {"role": "user", "content": prompt + END_INSTRUCTION}
             ],
-            temperature=0.7,
-            max_tokens=2000
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop=[END_MARKER],
+            stream=True
         )
-        return response.choices[0].message.content
+        # Closing the stream on every exit (including cancellation when the
+        # user leaves) aborts the HTTP request so Groq stops generating and the
+        # connection is returned to the pool
+        async with response:
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+                delta = chunk.choices[0].delta.content or ""
+                if delta:
+                    buffer += delta
+                    yield buffer.split(END_MARKER)[0]
     except Exception as e:
-        return f"Error generating course structure: {str(e)}"
+        yield f"{error_prefix}: {str(e)}"
+        return
+    
+    # Yield the final cleaned text so callers see exactly what gets cached
+    buffer = buffer.split(END_MARKER)[0].rstrip()
+    yield buffer
+    # Responses truncated at max_tokens are incomplete, so they are not cached
+    if buffer and finish_reason != "length":
+        await _run_blocking(_cache_set, key, buffer)
+        if vector is not None:
+            _semantic_store((name, *semantic_scope), vector, buffer)
 
 
-def recommend_topics(subject, level, goals, focus_area):
+async def generate_course_structure(subject, level, duration, goals):
+    """
+    Generate a structured course outline with modules and topics.
+    
+    Args:
+        subject: The subject/course name
+        level: Academic level (school/college/university)
+        duration: Duration in weeks or semesters
+        goals: Learning goals and objectives
+    
+    Yields:
+        Structured course outline as formatted text, growing as it streams
+    """
+    prompt = STRUCTURE_INSTRUCTIONS + PROMPT_INPUTS_SEPARATOR + build_header(subject, level, duration, goals)
+
+    async for partial in _stream_completion(
+        name="generate_course_structure",
+        system_message=STRUCTURE_SYSTEM_MSG,
+        prompt=prompt,
+        temperature=0.7,
+        max_tokens=MAX_TOKENS["generate_course_structure"],
+        error_prefix=STRUCTURE_ERROR_PREFIX,
+        semantic_key=f"{subject}|{goals}",
+        semantic_scope=(level, duration)
+    ):
+        yield partial
+
+
+async def recommend_topics(subject, level, goals, focus_area):
     """
     Suggest relevant topics based on subject, level, and goals.
     
@@ -78,40 +478,26 @@ def recommend_topics(subject, level, goals, focus_area):
         goals: Learning goals
         focus_area: Specific area of focus (optional)
     
-    Returns:
-        List of recommended topics with justifications
+    Yields:
+        List of recommended topics with justifications, growing as it streams
     """
-    prompt = f"""You are an expert academic curriculum designer. Recommend relevant topics for:
-
-Subject: {subject}
-Academic Level: {level}
-Learning Goals: {goals}
-Focus Area: {focus_area if focus_area else "General coverage"}
-
-Provide:
-1. 10-15 recommended topics
-2. Brief justification for each topic's inclusion
-3. Suggested depth of coverage (introductory/intermediate/advanced)
-4. Prerequisites if any
-
-Be specific and academically rigorous."""
+    prompt = TOPICS_INSTRUCTIONS + PROMPT_INPUTS_SEPARATOR + build_header(
+        subject, level, goals=goals, focus_area=focus_area or "General coverage")
 
-    try:
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert academic curriculum designer who recommends relevant and impactful learning topics."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2000
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error recommending topics: {str(e)}"
+    async for partial in _stream_completion(
+        name="recommend_topics",
+        system_message=TOPICS_SYSTEM_MSG,
+        prompt=prompt,
+        temperature=0.7,
+        max_tokens=MAX_TOKENS["recommend_topics"],
+        error_prefix="Error recommending topics",
+        semantic_key=f"{subject}|{goals}|{focus_area}",
+        semantic_scope=(level,)
+    ):
+        yield partial
 
 
-def create_curriculum_plan(subject, level, duration, goals, structure):
+async def create_curriculum_plan(subject, level, duration, goals, structure):
     """
     Create a semester-wise or timeline-based curriculum plan.
     
@@ -120,43 +506,28 @@ def create_curriculum_plan(subject, level, duration, goals, structure):
         level: Academic level
         duration: Duration (e.g., "1 semester", "12 weeks")
         goals: Learning goals
-        structure: Previously generated course structure (optional)
+        structure: Previously generated course structure (optional, not
+            included in the prompt; the plan is built from the inputs alone)
     
-    Returns:
-        Timeline-based curriculum plan
+    Yields:
+        Timeline-based curriculum plan, growing as it streams
     """
-    prompt = f"""You are an expert academic curriculum designer. Create a detailed timeline-based curriculum plan for:
-
-Subject: {subject}
-Academic Level: {level}
-Duration: {duration}
-Learning Goals: {goals}
-
-Create a week-by-week or session-by-session plan that includes:
-1. Clear timeline (Week 1, Week 2, etc. or Session 1, Session 2, etc.)
-2. Topics to be covered in each period
-3. Suggested activities (lectures, labs, assignments, assessments)
-4. Estimated hours per topic
-5. Key milestones and assessment points
+    prompt = TIMELINE_INSTRUCTIONS + PROMPT_INPUTS_SEPARATOR + build_header(subject, level, duration, goals)
 
-Ensure logical progression from basics to advanced concepts. Be realistic about pacing."""
-
-    try:
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert academic curriculum designer who creates realistic, well-paced learning schedules."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2500
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error creating curriculum plan: {str(e)}"
+    async for partial in _stream_completion(
+        name="create_curriculum_plan",
+        system_message=TIMELINE_SYSTEM_MSG,
+        prompt=prompt,
+        temperature=0.7,
+        max_tokens=MAX_TOKENS["create_curriculum_plan"],
+        error_prefix="Error creating curriculum plan",
+        semantic_key=f"{subject}|{goals}",
+        semantic_scope=(level, duration)
+    ):
+        yield partial
 
 
-def map_learning_outcomes(subject, level, modules_topics):
+async def map_learning_outcomes(subject, level, modules_topics):
     """
     Map each topic/module to measurable learning outcomes.
     
@@ -165,173 +536,474 @@ def map_learning_outcomes(subject, level, modules_topics):
         level: Academic level
         modules_topics: Description of modules and topics
     
-    Returns:
-        Learning outcomes mapped to modules/topics
+    Yields:
+        Learning outcomes mapped to modules/topics, growing as it streams
     """
-    prompt = f"""You are an expert academic curriculum designer. Create measurable learning outcomes for:
-
-Subject: {subject}
-Academic Level: {level}
-Content: {modules_topics}
+    prompt = OUTCOMES_INSTRUCTIONS + PROMPT_INPUTS_SEPARATOR + build_header(subject, level)
+    prompt += f"\nContent: {modules_topics}"
 
-For each major module/topic, define:
-1. 3-5 specific learning outcomes using Bloom's Taxonomy
-2. Use action verbs (understand, analyze, create, evaluate, apply, etc.)
-3. Make outcomes measurable and assessable
-4. Align outcomes with the academic level
-5. Include cognitive, skill-based, and affective outcomes where appropriate
+    async for partial in _stream_completion(
+        name="map_learning_outcomes",
+        system_message=OUTCOMES_SYSTEM_MSG,
+        prompt=prompt,
+        temperature=0.6,
+        max_tokens=MAX_TOKENS["map_learning_outcomes"],
+        # No semantic key: outcomes depend on the full content, not just the inputs
+        error_prefix=OUTCOMES_ERROR_PREFIX
+    ):
+        yield partial
 
-Format: Module/Topic → Learning Outcomes (numbered list)
 
-Be precise and use proper educational outcome language."""
+async def optimize_curriculum(subject, level, duration, goals, current_plan):
+    """
+    Optimize curriculum for difficulty progression, relevance, and balance.
+    
+    Args:
+        subject: The subject/course name
+        level: Academic level
+        duration: Duration
+        goals: Learning goals
+        current_plan: Current curriculum plan to optimize
+    
+    Yields:
+        Optimized curriculum with recommendations, growing as it streams
+    """
+    prompt = OPTIMIZE_INSTRUCTIONS + PROMPT_INPUTS_SEPARATOR + build_header(subject, level, duration, goals)
+    prompt += f"\nCurrent Plan Summary: {current_plan[:500] if current_plan else 'Generate fresh optimization'}"
 
-    try:
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert academic curriculum designer who writes clear, measurable learning outcomes aligned with Bloom's Taxonomy."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.6,
-            max_tokens=2500
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error mapping learning outcomes: {str(e)}"
+    async for partial in _stream_completion(
+        name="optimize_curriculum",
+        system_message=OPTIMIZE_SYSTEM_MSG,
+        prompt=prompt,
+        temperature=0.6,
+        max_tokens=MAX_TOKENS["optimize_curriculum"],
+        error_prefix="Error optimizing curriculum",
+        semantic_key=None if current_plan else f"{subject}|{goals}",
+        semantic_scope=(level, duration)
+    ):
+        yield partial
 
 
-def optimize_curriculum(subject, level, duration, goals, current_plan):
+async def generate_combined(subject, level, duration, goals, focus_area):
     """
-    Optimize curriculum for difficulty progression, relevance, and balance.
+    Generate course structure, topics and learning outcomes in a single call.
     
     Args:
         subject: The subject/course name
         level: Academic level
         duration: Duration
         goals: Learning goals
-        current_plan: Current curriculum plan to optimize
+        focus_area: Specific area of focus (optional)
+    
+    Yields:
+        Raw response with sections separated by SECTION_MARKER, growing as it streams
+    """
+    prompt = COMBINED_INSTRUCTIONS + PROMPT_INPUTS_SEPARATOR + build_header(
+        subject, level, duration, goals, focus_area or "General coverage")
+
+    async for partial in _stream_completion(
+        name="generate_combined",
+        system_message=COMBINED_SYSTEM_MSG,
+        prompt=prompt,
+        temperature=0.7,
+        max_tokens=MAX_TOKENS["generate_combined"],
+        error_prefix=COMBINED_ERROR_PREFIX,
+        semantic_key=f"{subject}|{goals}|{focus_area}",
+        semantic_scope=(level, duration)
+    ):
+        yield partial
+
+
+def split_combined(text):
+    """
+    Split a generate_combined response into its sections.
     
     Returns:
-        Optimized curriculum with recommendations
+        List of up to three section texts, in COMBINED_SECTION_KEYS order
     """
-    prompt = f"""You are an expert academic curriculum designer. Optimize the curriculum for:
+    sections = [section.strip() for section in text.split(SECTION_MARKER)]
+    if sections and not sections[0] and len(sections) > 1:
+        sections = sections[1:]
+    return sections[:len(COMBINED_SECTION_KEYS)]
 
-Subject: {subject}
-Academic Level: {level}
-Duration: {duration}
-Learning Goals: {goals}
-Current Plan Summary: {current_plan[:500] if current_plan else "Generate fresh optimization"}
 
-Analyze and optimize for:
-1. **Difficulty Progression**: Ensure smooth transition from basic to advanced
-2. **Topic Relevance**: Prioritize high-impact, industry-relevant topics
-3. **Academic Balance**: Balance theory, practice, and assessments
-4. **Cognitive Load**: Avoid overwhelming students in any period
-5. **Redundancy**: Identify and eliminate duplicate content
-6. **Gaps**: Identify missing critical topics
+# ============================================================================
+# BLOOM'S TAXONOMY ANALYSIS
+# ============================================================================
 
-Provide:
-- Overall curriculum health score (0-100)
-- Specific optimization recommendations
-- Suggested reordering or restructuring
-- Balance metrics (theory vs practice ratio, assessment distribution)
+# Action verbs per cognitive level, from lowest to highest
+BLOOM_LEVELS = [
+    ("Remember", ["define", "list", "recall", "identify", "name", "state", "recognize", "recognise", "describe", "memorize"]),
+    ("Understand", ["understand", "explain", "summarize", "summarise", "classify", "compare", "interpret", "discuss", "illustrate", "paraphrase"]),
+    ("Apply", ["apply", "implement", "use", "solve", "demonstrate", "execute", "compute", "calculate", "operate", "practice"]),
+    ("Analyze", ["analyze", "analyse", "differentiate", "examine", "distinguish", "investigate", "organize", "organise", "deconstruct", "contrast"]),
+    ("Evaluate", ["evaluate", "assess", "critique", "justify", "judge", "defend", "argue", "appraise", "validate", "prioritize"]),
+    ("Create", ["create", "design", "develop", "construct", "formulate", "compose", "invent", "plan", "produce", "build"]),
+]
 
-Be critical and constructive."""
+# Leading word of a bulleted outcome line ("1.", "1.2)", "a)", "-", "*", "•"),
+# optionally bolded and after a "Students will be able to" style lead-in.
+# Numeric bullets need their "." or ")" so lines such as "2024 plan" are not
+# mistaken for outcomes. Headings and the rest of each sentence are not scanned.
+_OUTCOME_VERB_RE = re.compile(
+    r"^[ \t]*(?:[-*•]|\d+(?:\.\d+)*[.)]|[a-z][.)])[ \t]+(?:\*\*)?"
+    r"(?:(?:students|learners|participants)[ \t]+(?:will|should|can)[ \t]+(?:be[ \t]+able[ \t]+to[ \t]+)?)?"
+    r"(?:\*\*)?([a-z]+)",
+    re.IGNORECASE | re.MULTILINE
+)
 
-    try:
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert academic curriculum designer who optimizes learning experiences for maximum effectiveness and balance."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.6,
-            max_tokens=2500
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error optimizing curriculum: {str(e)}"
+BLOOM_VERB_LEVELS = {verb: level for level, (_, verbs) in enumerate(BLOOM_LEVELS) for verb in verbs}
+
+
+def extract_outcome_verbs(text):
+    """
+    Return the leading verb of each bulleted outcome line, lowercased.
+    """
+    return [match.group(1).lower() for match in _OUTCOME_VERB_RE.finditer(text)]
+
+
+def score_bloom_levels(text):
+    """
+    Count the Bloom's taxonomy action verbs used in a block of outcomes.
+    
+    Only the verb that opens each outcome line is counted.
+    
+    Args:
+        text: Learning outcomes text
+    
+    Returns:
+        List of verb counts, one per entry of BLOOM_LEVELS
+    """
+    counts = [0] * len(BLOOM_LEVELS)
+    for verb in extract_outcome_verbs(text):
+        level = BLOOM_VERB_LEVELS.get(verb)
+        if level is not None:
+            counts[level] += 1
+    return counts
+
+
+def format_bloom_summary(text):
+    """
+    Summarize the cognitive levels covered by a set of learning outcomes.
+    
+    Returns:
+        Markdown table of verb counts per Bloom level, or "" if none were found
+    """
+    counts = score_bloom_levels(text)
+    total = sum(counts)
+    if not total:
+        return ""
+    
+    summary = "\n\n#### 🧠 Bloom's Taxonomy Coverage\n\n"
+    summary += "| Level | Action verbs | Share |\n|---|---|---|\n"
+    for (name, _), count in zip(BLOOM_LEVELS, counts):
+        summary += f"| {name} | {count} | {count * 100 // total}% |\n"
+    return summary
 
 
 # ============================================================================
 # GRADIO UI FUNCTIONS
 # ============================================================================
 
-def generate_full_curriculum(subject, level, duration, goals, focus_area):
+# Section keys and headings, in display order, for the full curriculum view
+CURRICULUM_SECTIONS = [
+    ("structure", "## 📚 1. COURSE STRUCTURE"),
+    ("topics", "## 💡 2. RECOMMENDED TOPICS"),
+    ("timeline", "## 📅 3. CURRICULUM TIMELINE"),
+    ("outcomes", "## 🎯 4. LEARNING OUTCOMES MAPPING"),
+    ("optimization", "## ⚡ 5. CURRICULUM OPTIMIZATION"),
+]
+
+# Shown in place of a combined-call section the model did not produce
+SECTION_NOT_GENERATED = "⚠️ *This section was not generated. Use the individual buttons to retry.*"
+
+
+def _outcomes_summary(outcomes):
+    """
+    Bloom's coverage summary for outcomes that finished normally, else "".
+    """
+    if not outcomes or outcomes == SECTION_NOT_GENERATED:
+        return ""
+    if outcomes.startswith((OUTCOMES_ERROR_PREFIX, COMBINED_ERROR_PREFIX)):
+        return ""
+    return format_bloom_summary(outcomes)
+
+
+async def _collect_section(key, stream, partials, updated):
+    """
+    Drain a section stream into the shared partials dict, signalling each update.
+    
+    Returns:
+        The final text of the section
+    """
+    async for partial in stream:
+        partials[key] = partial
+        updated.set()
+    return partials.get(key, "")
+
+
+# Seconds to wait after the last edit to the goals before prefetching
+PREFETCH_DEBOUNCE = 2.0
+
+# Session hash -> inputs key of that session's most recent prefetch request
+_prefetch_latest = {}
+
+# Inputs key -> in-flight prefetch task, so Generate can await it instead of
+# starting a second structure generation
+_prefetch_tasks = {}
+
+
+# Monotonic time of the last connection warm-up
+_last_warm_up = 0.0
+
+
+async def warm_up_connection():
+    """
+    Open the Groq connection ahead of the first click with a cheap request.
+    
+    Runs on page load inside the server's event loop so the pooled connection
+    is reusable by later requests; skipped while a warm connection is likely
+    still alive.
+    """
+    global _last_warm_up
+    now = time.monotonic()
+    if now - _last_warm_up < KEEPALIVE_EXPIRY:
+        return
+    _last_warm_up = now
+    try:
+        await client.models.list()
+    except Exception:
+        pass
+
+
+def _inputs_key(subject, level, duration, goals):
+    """
+    Hash the structure inputs so a prefetched structure can be matched later.
+    """
+    return hashlib.sha256(f"{subject}|{level}|{duration}|{goals}".encode("utf-8")).hexdigest()
+
+
+async def _run_prefetch(key, subject, level, duration, goals):
+    """
+    Generate the structure for a prefetch, stopping as soon as no session
+    still wants these inputs.
+    
+    Returns:
+        The structure text, or None if superseded or failed
+    """
+    stream = generate_course_structure(subject, level, duration, goals)
+    structure = ""
+    try:
+        async for structure in stream:
+            if key not in _prefetch_latest.values():
+                return None
+    finally:
+        # Closing the generator closes the Groq stream, so abandoned
+        # prefetches stop billing immediately
+        await stream.aclose()
+        if _prefetch_tasks.get(key) is asyncio.current_task():
+            del _prefetch_tasks[key]
+    if not structure or structure.startswith(STRUCTURE_ERROR_PREFIX):
+        return None
+    return structure
+
+
+async def prefetch_structure(subject, level, duration, goals, structure_state, request: gr.Request = None):
+    """
+    Speculatively generate the course structure while the user is still typing.
+    
+    Waits for a short debounce; if a newer edit arrives for the same session,
+    either during the debounce or while generating, this request is abandoned
+    and the previous state is kept.
+    
+    Returns:
+        Dict with the inputs key and structure text, or the previous state
+    """
+    if not subject or not level or not duration or not goals:
+        return structure_state
+    
+    key = _inputs_key(subject, level, duration, goals)
+    if structure_state and structure_state.get("key") == key:
+        return structure_state
+    
+    session = request.session_hash if request else None
+    _prefetch_latest[session] = key
+    await asyncio.sleep(PREFETCH_DEBOUNCE)
+    if _prefetch_latest.get(session) != key:
+        return structure_state
+    
+    task = _prefetch_tasks.get(key)
+    if task is None:
+        task = _prefetch_tasks[key] = asyncio.create_task(
+            _run_prefetch(key, subject, level, duration, goals))
+    try:
+        # Shielded so a cancelled event does not cancel a task Generate may await
+        structure = await asyncio.shield(task)
+    finally:
+        superseded = _prefetch_latest.get(session) != key
+        if not superseded:
+            del _prefetch_latest[session]
+    
+    if superseded or structure is None:
+        return structure_state
+    return {"key": key, "structure": structure}
+
+
+async def _prefetched_structure(structure_state, key):
+    """
+    Return the structure prefetched for key, waiting for one still in flight.
+    
+    Returns:
+        The structure text, or None if there is none for these inputs
+    """
+    if structure_state and structure_state.get("key") == key:
+        return structure_state["structure"]
+    task = _prefetch_tasks.get(key)
+    if task is None:
+        return None
+    return await asyncio.shield(task)
+
+
+async def generate_full_curriculum(subject, level, duration, goals, focus_area, structure_state=None):
     """
     Generate complete curriculum with all components.
+
+    Structure, topics and outcomes come from a single combined call, while
+    the timeline and optimization, which only need the inputs, run
+    alongside. A structure already prefetched for the same inputs is reused
+    instead, with topics and outcomes requested individually; a prefetch
+    still in flight for these inputs is awaited rather than duplicated. The
+    combined Markdown is yielded as each section streams in.
     """
     if not subject or not level or not duration or not goals:
-        return "❌ Please fill in all required fields: Subject, Level, Duration, and Goals."
+        yield "❌ Please fill in all required fields: Subject, Level, Duration, and Goals."
+        return
     
-    output = "# 🎓 COMPREHENSIVE CURRICULUM DESIGN SYSTEM\n\n"
-    output += f"**Subject:** {subject} | **Level:** {level} | **Duration:** {duration}\n\n"
-    output += "---\n\n"
+    header = "# 🎓 COMPREHENSIVE CURRICULUM DESIGN SYSTEM\n\n"
+    header += f"**Subject:** {subject} | **Level:** {level} | **Duration:** {duration}\n\n"
+    header += "---\n\n"
     
-    # Generate each component
-    output += "## 📚 1. COURSE STRUCTURE\n\n"
-    structure = generate_course_structure(subject, level, duration, goals)
-    output += structure + "\n\n---\n\n"
+    partials = {}
+    updated = asyncio.Event()
     
-    output += "## 💡 2. RECOMMENDED TOPICS\n\n"
-    topics = recommend_topics(subject, level, goals, focus_area)
-    output += topics + "\n\n---\n\n"
+    def render():
+        output = header
+        for key, title in CURRICULUM_SECTIONS:
+            output += title + "\n\n"
+            output += partials.get(key, "⏳ *Generating...*") + "\n\n---\n\n"
+        return output
     
-    output += "## 📅 3. CURRICULUM TIMELINE\n\n"
-    timeline = create_curriculum_plan(subject, level, duration, goals, structure)
-    output += timeline + "\n\n---\n\n"
+    async def prefetched_pipeline(structure):
+        # Structure is already known, so outcomes can build on it right away
+        partials["structure"] = structure
+        updated.set()
+        await asyncio.gather(
+            _collect_section("topics", recommend_topics(subject, level, goals, focus_area), partials, updated),
+            _collect_section("outcomes", map_learning_outcomes(subject, level, structure), partials, updated)
+        )
     
-    output += "## 🎯 4. LEARNING OUTCOMES MAPPING\n\n"
-    outcomes = map_learning_outcomes(subject, level, structure)
-    output += outcomes + "\n\n---\n\n"
+    async def combined_pipeline():
+        # One call streams structure, topics and outcomes
+        streamed = 0
+        async for text in generate_combined(subject, level, duration, goals, focus_area):
+            if text.startswith(COMBINED_ERROR_PREFIX):
+                # Keep the sections that finished; report the failure in the
+                # one that was streaming and in those not yet started
+                for key in COMBINED_SECTION_KEYS[max(streamed - 1, 0):]:
+                    partials[key] = text
+                updated.set()
+                break
+            sections = split_combined(text)
+            streamed = len(sections)
+            for key, section in zip(COMBINED_SECTION_KEYS, sections):
+                partials[key] = section
+            updated.set()
+        for key in COMBINED_SECTION_KEYS:
+            partials.setdefault(key, SECTION_NOT_GENERATED)
     
-    output += "## ⚡ 5. CURRICULUM OPTIMIZATION\n\n"
-    optimization = optimize_curriculum(subject, level, duration, goals, timeline)
-    output += optimization + "\n\n---\n\n"
+    async def structure_sections():
+        prefetched = await _prefetched_structure(structure_state, _inputs_key(subject, level, duration, goals))
+        if prefetched:
+            await prefetched_pipeline(prefetched)
+        else:
+            await combined_pipeline()
     
-    output += "\n\n✅ **Curriculum design complete!** Review each section above for your comprehensive academic plan."
+    async def run_pipeline():
+        try:
+            # The timeline and optimization prompts only use the inputs
+            await asyncio.gather(
+                structure_sections(),
+                _collect_section("timeline", create_curriculum_plan(subject, level, duration, goals, ""), partials, updated),
+                _collect_section("optimization", optimize_curriculum(subject, level, duration, goals, ""), partials, updated)
+            )
+        finally:
+            updated.set()
     
-    return output
+    pipeline = asyncio.create_task(run_pipeline())
+    try:
+        yield render()
+        while not pipeline.done():
+            await updated.wait()
+            updated.clear()
+            yield render()
+        await pipeline
+    finally:
+        pipeline.cancel()
+    
+    partials["outcomes"] += _outcomes_summary(partials["outcomes"])
+    yield render() + "\n\n✅ **Curriculum design complete!** Review each section above for your comprehensive academic plan."
 
 
 # ============================================================================
 # GRADIO INTERFACE
 # ============================================================================
 
+# Custom CSS for professional styling
+CSS = """
+.container {
+    max-width: 1200px;
+    margin: auto;
+}
+.header {
+    text-align: center;
+    padding: 20px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 10px;
+    margin-bottom: 20px;
+}
+.output-box {
+    font-size: 14px;
+    line-height: 1.6;
+}
+"""
+
+HEADER_HTML = """
+<div class="header">
+    <h1>🎓 AI-Powered Curriculum Design System</h1>
+    <p>Comprehensive curriculum generation for educational excellence</p>
+</div>
+"""
+
+LEVEL_CHOICES = [
+    "High School",
+    "Undergraduate (Bachelor's)",
+    "Graduate (Master's)",
+    "Doctoral (PhD)",
+    "Professional Certification",
+    "Continuing Education"
+]
+
+
 def create_interface():
     """
     Create the Gradio interface for the curriculum design system.
     """
     
-    # Custom CSS for professional styling
-    css = """
-    .container {
-        max-width: 1200px;
-        margin: auto;
-    }
-    .header {
-        text-align: center;
-        padding: 20px;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-radius: 10px;
-        margin-bottom: 20px;
-    }
-    .output-box {
-        font-size: 14px;
-        line-height: 1.6;
-    }
-    """
-    
-    with gr.Blocks(css=css, title="AI Curriculum Designer") as interface:
+    with gr.Blocks(css=CSS, title="AI Curriculum Designer") as interface:
         
         # Header
-        gr.HTML("""
-            <div class="header">
-                <h1>🎓 AI-Powered Curriculum Design System</h1>
-                <p>Comprehensive curriculum generation for educational excellence</p>
-            </div>
-        """)
+        gr.HTML(HEADER_HTML)
         
         gr.Markdown("""
         ### Welcome to the Curriculum Design System
@@ -351,14 +1023,7 @@ def create_interface():
                 
                 level_input = gr.Dropdown(
                     label="Academic Level *",
-                    choices=[
-                        "High School",
-                        "Undergraduate (Bachelor's)",
-                        "Graduate (Master's)",
-                        "Doctoral (PhD)",
-                        "Professional Certification",
-                        "Continuing Education"
-                    ],
+                    choices=LEVEL_CHOICES,
                     value="Undergraduate (Bachelor's)"
                 )
                 
@@ -406,40 +1071,77 @@ def create_interface():
                     elem_classes="output-box"
                 )
         
+        # Prime the Groq connection before the user's first request
+        interface.load(fn=warm_up_connection, inputs=None, outputs=None, show_progress="hidden")
+        
+        # Course structure prefetched in the background while goals are typed
+        structure_state = gr.State(None)
+        
+        goals_input.change(
+            fn=prefetch_structure,
+            inputs=[subject_input, level_input, duration_input, goals_input, structure_state],
+            outputs=structure_state,
+            show_progress="hidden",
+            trigger_mode="multiple",
+            concurrency_limit=None
+        )
+        
         # Event handlers for full curriculum generation
         generate_btn.click(
             fn=generate_full_curriculum,
-            inputs=[subject_input, level_input, duration_input, goals_input, focus_input],
+            inputs=[subject_input, level_input, duration_input, goals_input, focus_input, structure_state],
             outputs=output_display
         )
         
         # Event handlers for individual components
+        async def run_structure(s, l, d, g):
+            async for partial in generate_course_structure(s, l, d, g):
+                yield "## 📚 COURSE STRUCTURE\n\n" + partial
+        
+        async def run_topics(s, l, g, f):
+            async for partial in recommend_topics(s, l, g, f):
+                yield "## 💡 RECOMMENDED TOPICS\n\n" + partial
+        
+        async def run_timeline(s, l, d, g):
+            async for partial in create_curriculum_plan(s, l, d, g, ""):
+                yield "## 📅 CURRICULUM TIMELINE\n\n" + partial
+        
+        async def run_outcomes(s, l):
+            partial = ""
+            async for partial in map_learning_outcomes(s, l, "Course content as defined"):
+                yield "## 🎯 LEARNING OUTCOMES\n\n" + partial
+            yield "## 🎯 LEARNING OUTCOMES\n\n" + partial + _outcomes_summary(partial)
+        
+        async def run_optimize(s, l, d, g):
+            async for partial in optimize_curriculum(s, l, d, g, ""):
+                yield "## ⚡ CURRICULUM OPTIMIZATION\n\n" + partial
+        
         structure_btn.click(
-            fn=lambda s, l, d, g: "## 📚 COURSE STRUCTURE\n\n" + generate_course_structure(s, l, d, g),
+            fn=run_structure,
             inputs=[subject_input, level_input, duration_input, goals_input],
             outputs=output_display
         )
         
         topics_btn.click(
-            fn=lambda s, l, g, f: "## 💡 RECOMMENDED TOPICS\n\n" + recommend_topics(s, l, g, f),
+            fn=run_topics,
             inputs=[subject_input, level_input, goals_input, focus_input],
             outputs=output_display
         )
         
         timeline_btn.click(
-            fn=lambda s, l, d, g: "## 📅 CURRICULUM TIMELINE\n\n" + create_curriculum_plan(s, l, d, g, ""),
+            fn=run_timeline,
             inputs=[subject_input, level_input, duration_input, goals_input],
             outputs=output_display
         )
         
         outcomes_btn.click(
-            fn=lambda s, l: "## 🎯 LEARNING OUTCOMES\n\n" + map_learning_outcomes(s, l, "Course content as defined"),
+            fn=run_outcomes,
             inputs=[subject_input, level_input],
             outputs=output_display
         )
         
         optimize_btn.click(
-            fn=lambda s, l, d, g: "## ⚡ CURRICULUM OPTIMIZATION\n\n" + optimize_curriculum(s, l, d, g, ""),
+            fn=run_optimize,
             inputs=[subject_input, level_input, duration_input, goals_input],
             outputs=output_display
         )
@@ -473,6 +1175,11 @@ if __name__ == "__main__":
     print("🚀 Starting AI Curriculum Design System...")
     print("📍 Access the application at: http://localhost:7860")
     
+    # Load the embedding model in the background so the first request does
+    # not wait for it to download
+    if SEMANTIC_CACHE_AVAILABLE:
+        EXECUTOR.submit(_load_embedder)
+    
     # Create and launch the interface
     app = create_interface()
     app.launch(
@@ -481,6 +1188,3 @@ if __name__ == "__main__":
         share=False,
         show_error=True
     )
-    
-ui.launch()
-